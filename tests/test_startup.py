@@ -4,15 +4,25 @@ Tests all major components and dependencies
 """
 import sys
 import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import os
 
-def test_dependency(name):
-    """Test if a dependency can be imported."""
+def test_dependency(name, execute=False):
+    """
+    Test if a dependency can be imported.
+    
+    By default only the module spec is resolved, which avoids running the
+    package's top-level code. Pass execute=True to actually import it.
+    """
     try:
-        importlib.import_module(name)
+        if execute:
+            importlib.import_module(name)
+        elif importlib.util.find_spec(name) is None:
+            return False, f"No module named '{name}'"
         return True
-    except ImportError as e:
+    except (ImportError, ValueError) as e:
         return False, str(e)
 
 def main():
@@ -21,7 +31,7 @@ def main():
     
     # Core dependencies to test
     DEPENDENCIES = {
-        'Core GIS': ['geopandas', 'shapely', 'fiona', 'pyogrio'],
+        'Core GIS': ['geopandas', 'shapely', 'pyogrio', 'pyarrow'],
         'Visualization': ['plotly', 'folium', 'streamlit'],
         'Export': ['fpdf', 'openpyxl'],
         'Analysis': ['scipy', 'statsmodels'],
@@ -32,6 +42,9 @@ def main():
     if test_llm:
         DEPENDENCIES['LLM Integration'] = ['ollama']
     
+    # Dependencies that must actually import, not just be installed
+    EXECUTE = {'ollama'}
+    
     print("🔍 Running Walter startup tests...")
     print("\n1. Testing Python version...")
     python_version = sys.version_info
@@ -45,10 +58,18 @@ def main():
     print("\n2. Testing dependencies...")
     all_passed = True
     
+    # Run the checks concurrently, then report them grouped by category
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            dep: executor.submit(test_dependency, dep, execute=dep in EXECUTE)
+            for deps in DEPENDENCIES.values()
+            for dep in deps
+        }
+    
     for category, deps in DEPENDENCIES.items():
         print(f"\n📦 Testing {category} dependencies:")
         for dep in deps:
-            result = test_dependency(dep)
+            result = futures[dep].result()
             if isinstance(result, tuple):
                 print(f"❌ {dep}: Failed - {result[1]}")
                 all_passed = False
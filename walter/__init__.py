@@ -1,14 +1,16 @@
 """
 Walter - Your AI GIS Assistant
 """
-
-from . import cli
-from . import commands
-from . import integrations
-from . import utils
+import importlib
 
 __version__ = "0.1.0"
 __author__ = "Brandon Estevez"
 __email__ = "your.email@example.com"
 
-__all__ = ["cli", "commands", "integrations", "utils"] 
\ No newline at end of file
+__all__ = ["cli", "commands", "integrations", "utils"]
+
+def __getattr__(name):
+    """Import submodules on first access to keep startup fast."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
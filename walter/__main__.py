@@ -0,0 +1,27 @@
+"""
+Walter console entry points
+"""
+import importlib.util
+import sys
+
+from . import __version__
+
+def main():
+    """Run the Walter CLI, answering --version without loading Typer."""
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        print(f"Walter version {__version__}")
+        return
+    
+    from .cli import app
+    app()
+
+def gui():
+    """Run the Walter GUI, pointing at the gui extra if Streamlit is missing."""
+    if importlib.util.find_spec("streamlit") is None:
+        sys.exit("The Walter GUI needs extra dependencies: pip install walter-gis[gui]")
+    
+    from .gui import main as gui_main
+    gui_main()
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ from rich.panel import Panel
 from pathlib import Path
 from typing import Optional
 
-from .commands import describe
+from . import __version__
 
 # Initialize Typer app
 app = typer.Typer(
@@ -23,7 +23,7 @@ console = Console()
 def version_callback(value: bool):
     """Print version information."""
     if value:
-        print("[bold blue]Walter[/bold blue] version 0.1.0")
+        print(f"[bold blue]Walter[/bold blue] version {__version__}")
         raise typer.Exit()
 
 @app.callback()
@@ -47,8 +47,10 @@ def describe_data(
     format: str = typer.Option("markdown", "--format", "-f", help="Output format (markdown/html/text)"),
 ):
     """Generate professional descriptions for maps and datasets."""
+    from .commands.describe import generate_description
+    
     try:
-        result = describe.generate_description(input_file, format)
+        result = generate_description(input_file, format)
         if output:
             output.write_text(result)
             console.print(f"✨ Description saved to: {output}")
@@ -1,7 +1,14 @@
 """
 Walter command modules
 """
+import importlib
 
-from . import describe
+_SUBMODS = ("describe",)
 
-__all__ = ["describe"] 
\ No newline at end of file
+__all__ = list(_SUBMODS)
+
+def __getattr__(name):
+    """Import command modules on first access."""
+    if name in _SUBMODS:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,37 +1,69 @@
 """
 Walter describe command - Generate professional descriptions for GIS data
 """
-import geopandas as gpd
+import functools
+import pyogrio
 from pathlib import Path
 from typing import Optional, Dict, Any
 import json
 
-from ..utils.gis import get_crs_info, get_geometry_stats
+from ..utils.gis import get_crs_info, get_geometry_stats, get_geometry_types, read_gis_file
 from ..utils.text import format_output
 
-def analyze_dataset(file_path: Path) -> Dict[str, Any]:
+def analyze_dataset(file_path: Path, include_stats: bool = True) -> Dict[str, Any]:
     """
     Analyze a GIS dataset and extract key information.
     
+    Results are cached until the file's modification time or size changes,
+    so the returned dictionary should be treated as read-only.
+    
     Args:
         file_path: Path to the GIS file
+        include_stats: Whether to read geometries for statistics
         
     Returns:
         Dictionary containing dataset analysis
     """
-    # Read the dataset
-    gdf = gpd.read_file(file_path)
+    stat = file_path.stat()
+    return _analyze_dataset(file_path, stat.st_mtime_ns, stat.st_size, include_stats)
+
+@functools.lru_cache(maxsize=32)
+def _analyze_dataset(
+    file_path: Path,
+    mtime_ns: int,
+    size: int,
+    include_stats: bool,
+) -> Dict[str, Any]:
+    """Analyze a dataset; mtime_ns and size only serve as cache keys."""
+    # Read layer metadata without decoding geometries
+    meta = pyogrio.read_info(file_path, force_feature_count=True, force_total_bounds=include_stats)
+    
+    # A single feature is enough for the CRS and attribute sample
+    head = read_gis_file(file_path, max_features=1)
+    
+    # Statistics only need geometries, so attribute columns are skipped
+    if include_stats:
+        geoms = read_gis_file(file_path, columns=[])
+        geometry_type = get_geometry_types(geoms)
+        geometry_stats = get_geometry_stats(geoms, total_bounds=meta.get("total_bounds"))
+    else:
+        geometry_type = [meta["geometry_type"]] if meta["geometry_type"] else []
+        geometry_stats = {}
+    
+    columns = list(meta["fields"])
+    if meta["geometry_type"]:
+        columns.append(head.geometry.name)
     
     # Basic information
     info = {
         "filename": file_path.name,
         "format": file_path.suffix,
-        "feature_count": len(gdf),
-        "columns": list(gdf.columns),
-        "crs": get_crs_info(gdf),
-        "geometry_type": gdf.geometry.geom_type.unique().tolist(),
-        "geometry_stats": get_geometry_stats(gdf),
-        "attribute_sample": gdf.head(1).to_dict(orient="records")[0],
+        "feature_count": meta["features"],
+        "columns": columns,
+        "crs": get_crs_info(head),
+        "geometry_type": geometry_type,
+        "geometry_stats": geometry_stats,
+        "attribute_sample": head.iloc[0].drop(head.geometry.name, errors="ignore").to_dict() if len(head) else {},
     }
     
     return info
@@ -53,7 +85,7 @@ def generate_description(
         Formatted description string
     """
     # Analyze the dataset
-    info = analyze_dataset(file_path)
+    info = analyze_dataset(file_path, include_stats=include_stats)
     
     # Generate description components
     components = {
@@ -2,30 +2,173 @@
 Walter GUI using Streamlit
 """
 import streamlit as st
-import geopandas as gpd
-import folium
-from streamlit_folium import folium_static
-import plotly.express as px
-import plotly.graph_objects as go
 from pathlib import Path
+from typing import Optional
 import tempfile
+import shutil
 import os
-import json
-import pandas as pd
+import time
 
-from walter.commands.describe import analyze_dataset, generate_description
-from walter.integrations.llm import LLMManager
-from walter.utils.gis import validate_geometry
+# Layers with more features than this are simplified before display
+DISPLAY_SIMPLIFY_THRESHOLD = 5000
+
+# Charts plot at most this many sampled values per column
+VIZ_SAMPLE_SIZE = 50_000
+
+# Map layers larger than this many bytes are served instead of embedded
+STATIC_LAYER_THRESHOLD = 5_000_000
+
+# Streamlit serves files in this folder under app/static/
+STATIC_DIR = Path(__file__).parent / "static"
+
+# Temporary uploads carry this prefix so stale copies can be swept
+UPLOAD_PREFIX = "walter-upload-"
+
+# Uploads and static layers untouched for this many seconds are removed
+STALE_FILE_AGE = 24 * 60 * 60
+
+# Per-file caches keep at most this many uploads each (per-column caches 16x
+# as many); entries also expire after STALE_FILE_AGE since every upload gets
+# a fresh temp path
+CACHE_MAX_ENTRIES = 8
 
 def init_session_state():
     """Initialize session state variables."""
     if 'llm' not in st.session_state:
-        st.session_state.llm = LLMManager()
+        st.session_state.llm = None
+    if 'llm_settings' not in st.session_state:
+        st.session_state.llm_settings = {}
     if 'current_file' not in st.session_state:
         st.session_state.current_file = None
     if 'current_data' not in st.session_state:
         st.session_state.current_data = None
 
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=STALE_FILE_AGE, show_spinner=False)
+def _display_geojson(file_path: Path, _gdf) -> str:
+    """
+    Serialize the loaded data to a GeoJSON string for map display.
+    
+    Results are cached per file path; ``_gdf`` is excluded from hashing.
+    """
+    # Only geometry and feature ids are needed to draw the layers
+    gdf = _gdf[[_gdf.geometry.name]]
+    
+    if len(gdf) > DISPLAY_SIMPLIFY_THRESHOLD:
+        import geopandas as gpd
+        import numpy as np
+        import shapely
+        
+        minx, miny, maxx, maxy = gdf.total_bounds
+        tolerance = max(maxx - minx, maxy - miny) / 1000
+        simplified = shapely.simplify(
+            np.asarray(gdf.geometry.values), tolerance, preserve_topology=False
+        )
+        gdf = gdf.set_geometry(gpd.GeoSeries(simplified, index=gdf.index, crs=gdf.crs))
+    
+    return gdf.to_json()
+
+def _static_layer(file_path: Path, geojson: str) -> Optional[Path]:
+    """
+    Write a display layer to Streamlit's static folder.
+    
+    Streamlit only serves ``static/`` next to the main script, so this
+    requires running ``streamlit run walter/gui.py`` with
+    ``server.enableStaticServing = true``.
+    
+    Returns:
+        Path of the written file, or None if static serving is disabled
+        or the package directory is not writable
+    """
+    if not st.get_option("server.enableStaticServing"):
+        return None
+    
+    static_path = STATIC_DIR / f"{file_path.stem}.geojson"
+    try:
+        STATIC_DIR.mkdir(exist_ok=True)
+        if not static_path.exists():
+            static_path.write_text(geojson)
+    except OSError:
+        # Drop a partial write so the next render does not serve it
+        try:
+            static_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return None
+    return static_path
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=STALE_FILE_AGE, show_spinner=False)
+def _map_center(file_path: Path, _gdf) -> tuple:
+    """Return the (lat, lon) center of the loaded data's bounding box."""
+    minx, miny, maxx, maxy = _gdf.total_bounds
+    return (float(miny + maxy) / 2, float(minx + maxx) / 2)
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=STALE_FILE_AGE, show_spinner=False)
+def _geometry_types(file_path: Path, _gdf) -> list:
+    """Return the distinct geometry types in the loaded data."""
+    from walter.utils.gis import get_geometry_types
+    
+    return get_geometry_types(_gdf)
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=STALE_FILE_AGE, show_spinner=False)
+def _numeric_columns(file_path: Path, _gdf) -> list:
+    """Return the numeric attribute columns of the loaded data."""
+    return _gdf.select_dtypes(include="number").columns.tolist()
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=STALE_FILE_AGE, show_spinner=False)
+def _numeric_describe(file_path: Path, _gdf):
+    """Return summary statistics for all numeric columns of the loaded data."""
+    import pandas as pd
+    
+    numeric_cols = _numeric_columns(file_path, _gdf)
+    if not numeric_cols:
+        return pd.DataFrame()
+    return _gdf[numeric_cols].describe()
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES * 16, ttl=STALE_FILE_AGE, show_spinner=False)
+def _viz_array(file_path: Path, column: str, _gdf):
+    """Return a column's values, randomly downsampled for plotting."""
+    import numpy as np
+    
+    values = _gdf[column].dropna().to_numpy(dtype=float)
+    if values.size > VIZ_SAMPLE_SIZE:
+        values = np.random.default_rng(0).choice(values, VIZ_SAMPLE_SIZE, replace=False)
+    return values
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES * 16, ttl=STALE_FILE_AGE, show_spinner=False)
+def _histogram(file_path: Path, column: str, _gdf) -> tuple:
+    """Return bin centers, counts and widths for a column's histogram."""
+    import numpy as np
+    
+    values = _gdf[column].dropna().to_numpy(dtype=float)
+    counts, edges = np.histogram(values, bins=64)
+    return (edges[:-1] + edges[1:]) / 2, counts, np.diff(edges)
+
+def _attribute_table(gdf, include_wkb: bool = False):
+    """
+    Return the attribute table of a GeoDataFrame without its geometry column.
+    
+    Args:
+        gdf: GeoDataFrame to convert
+        include_wkb: Whether to keep geometries as a hex WKB column
+        
+    Returns:
+        Plain DataFrame suitable for tabular export
+    """
+    import pandas as pd
+    
+    df = pd.DataFrame(gdf.drop(columns=gdf.geometry.name))
+    if include_wkb:
+        df["geometry_wkb_hex"] = gdf.geometry.to_wkb(hex=True)
+    return df
+
+def _get_llm():
+    """Return the session's LLM manager, creating it on first use."""
+    if st.session_state.llm is None:
+        from walter.integrations.llm import LLMManager
+        
+        st.session_state.llm = LLMManager(**st.session_state.llm_settings)
+    return st.session_state.llm
+
 def render_sidebar():
     """Render the sidebar with LLM settings."""
     with st.sidebar:
@@ -48,12 +191,43 @@ def render_sidebar():
         )
         
         if st.button("Apply Settings"):
-            st.session_state.llm = LLMManager(
-                model=model,
-                temperature=temperature,
-            )
+            # The manager is rebuilt with these settings on next use
+            st.session_state.llm_settings = {
+                "model": model,
+                "temperature": temperature,
+            }
+            st.session_state.llm = None
             st.success("✅ Settings applied!")
 
+@st.cache_resource(ttl=60 * 60, show_spinner=False)
+def _sweep_stale_files() -> None:
+    """
+    Remove uploads and static layers left behind by ended sessions.
+    
+    Streamlit has no session-end hook, so this runs at most once an hour
+    per server process; files of live sessions are kept fresh by
+    ``render_file_upload``.
+    """
+    cutoff = time.time() - STALE_FILE_AGE
+    stale = [
+        *Path(tempfile.gettempdir()).glob(f"{UPLOAD_PREFIX}*"),
+        *STATIC_DIR.glob(f"{UPLOAD_PREFIX}*.geojson"),
+    ]
+    for path in stale:
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+def _clear_current_file():
+    """Remove the temporary copy of the previous upload from disk and state."""
+    if st.session_state.current_file is not None:
+        st.session_state.current_file.unlink(missing_ok=True)
+        (STATIC_DIR / f"{st.session_state.current_file.stem}.geojson").unlink(missing_ok=True)
+    st.session_state.current_file = None
+    st.session_state.current_data = None
+
 def render_file_upload():
     """Render the file upload section."""
     st.title("📁 Load GIS Data")
@@ -62,57 +236,80 @@ def render_file_upload():
         "Choose a GIS file",
         type=["shp", "geojson", "gpkg"],
         help="Upload a shapefile (as ZIP), GeoJSON, or GeoPackage file",
+        on_change=_clear_current_file,
     )
     
     if uploaded_file:
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix) as tmp:
-            tmp.write(uploaded_file.getvalue())
-            tmp_path = Path(tmp.name)
-        
-        try:
-            # Read the data
-            gdf = gpd.read_file(tmp_path)
-            st.session_state.current_file = tmp_path
-            st.session_state.current_data = gdf
+        # Only read the upload once; later reruns reuse the session state
+        if st.session_state.current_file is None:
+            from walter.utils.gis import read_gis_file
+            
+            # Stream to temp file, kept until the upload is replaced or removed
+            uploaded_file.seek(0)
+            with tempfile.NamedTemporaryFile(
+                delete=False, prefix=UPLOAD_PREFIX, suffix=Path(uploaded_file.name).suffix
+            ) as tmp:
+                shutil.copyfileobj(uploaded_file, tmp, length=1024 * 1024)
+                tmp_path = Path(tmp.name)
             
+            try:
+                # Read the data
+                gdf = read_gis_file(tmp_path)
+                st.session_state.current_file = tmp_path
+                st.session_state.current_data = gdf
+            except Exception as e:
+                st.error(f"❌ Error loading file: {str(e)}")
+                tmp_path.unlink(missing_ok=True)
+        else:
+            # Mark the upload as in use so the stale file sweep keeps it
+            try:
+                os.utime(st.session_state.current_file)
+            except OSError:
+                pass
+        
+        if st.session_state.current_data is not None:
             st.success(f"✅ Loaded {uploaded_file.name}")
             
             # Show preview
             st.subheader("📊 Data Preview")
-            st.dataframe(gdf.head())
-            
-        except Exception as e:
-            st.error(f"❌ Error loading file: {str(e)}")
-        finally:
-            # Clean up temp file
-            os.unlink(tmp_path)
+            st.dataframe(st.session_state.current_data.head())
 
 def render_map():
     """Render the interactive map."""
     if st.session_state.current_data is not None:
+        import folium
+        from streamlit_folium import folium_static
+        
         st.title("🗺️ Interactive Map")
         
         gdf = st.session_state.current_data
         
         # Create map centered on data
-        center = [
-            gdf.geometry.centroid.y.mean(),
-            gdf.geometry.centroid.x.mean()
-        ]
-        m = folium.Map(location=center, zoom_start=10)
+        center = _map_center(st.session_state.current_file, gdf)
+        m = folium.Map(location=list(center), zoom_start=10)
+        
+        # Large layers are fetched by the browser instead of inlined in the page
+        geojson = _display_geojson(st.session_state.current_file, gdf)
+        static_path = None
+        if len(geojson) > STATIC_LAYER_THRESHOLD:
+            static_path = _static_layer(st.session_state.current_file, geojson)
         
         # Add GeoJSON layer
-        folium.GeoJson(
-            gdf.__geo_interface__,
+        layer = folium.GeoJson(
+            str(static_path) if static_path else geojson,
             name="Data",
+            embed=static_path is None,
             style_function=lambda x: {
                 'fillColor': 'blue',
                 'color': 'black',
                 'weight': 1,
                 'fillOpacity': 0.5
             }
-        ).add_to(m)
+        )
+        if static_path:
+            # Folium reads the local file; the page loads it from Streamlit
+            layer.embed_link = f"app/static/{static_path.name}"
+        layer.add_to(m)
         
         # Add layer control
         folium.LayerControl().add_to(m)
@@ -123,12 +320,17 @@ def render_map():
 def render_statistics():
     """Render statistical analysis and charts."""
     if st.session_state.current_data is not None:
+        import folium
+        from streamlit_folium import folium_static
+        import plotly.express as px
+        import plotly.graph_objects as go
+        
         st.title("📈 Statistical Analysis")
         
         gdf = st.session_state.current_data
         
         # Select columns for analysis
-        numeric_cols = gdf.select_dtypes(include=['float64', 'int64']).columns
+        numeric_cols = _numeric_columns(st.session_state.current_file, gdf)
         if len(numeric_cols) > 0:
             selected_col = st.selectbox(
                 "Select column for analysis",
@@ -140,13 +342,14 @@ def render_statistics():
             # Basic statistics
             with col1:
                 st.subheader("📊 Summary Statistics")
-                stats = gdf[selected_col].describe()
+                stats = _numeric_describe(st.session_state.current_file, gdf)[selected_col]
                 st.dataframe(stats)
             
             # Distribution plot
             with col2:
                 st.subheader("📉 Distribution")
-                fig = go.Figure(data=[go.Histogram(x=gdf[selected_col])])
+                centers, counts, widths = _histogram(st.session_state.current_file, selected_col, gdf)
+                fig = go.Figure(data=[go.Bar(x=centers, y=counts, width=widths)])
                 fig.update_layout(
                     title=f"Distribution of {selected_col}",
                     xaxis_title=selected_col,
@@ -156,7 +359,8 @@ def render_statistics():
             
             # Box plot
             st.subheader("📦 Box Plot")
-            fig = px.box(gdf, y=selected_col)
+            values = _viz_array(st.session_state.current_file, selected_col, gdf)
+            fig = px.box(y=values, labels={"y": selected_col})
             fig.update_layout(title=f"Box Plot of {selected_col}")
             st.plotly_chart(fig)
             
@@ -164,15 +368,12 @@ def render_statistics():
             if st.checkbox("Show Spatial Pattern"):
                 st.subheader("🗺️ Spatial Pattern")
                 choropleth = folium.Map(
-                    location=[
-                        gdf.geometry.centroid.y.mean(),
-                        gdf.geometry.centroid.x.mean()
-                    ],
+                    location=list(_map_center(st.session_state.current_file, gdf)),
                     zoom_start=10
                 )
                 
                 folium.Choropleth(
-                    geo_data=gdf.__geo_interface__,
+                    geo_data=_display_geojson(st.session_state.current_file, gdf),
                     data=gdf,
                     columns=[gdf.index, selected_col],
                     key_on='feature.id',
@@ -197,7 +398,7 @@ def export_results():
             
             with tempfile.NamedTemporaryFile(delete=False) as tmp:
                 if export_format == "CSV":
-                    gdf.to_csv(tmp.name, index=False)
+                    _attribute_table(gdf, include_wkb=True).to_csv(tmp.name, index=False)
                     mime = "text/csv"
                     extension = "csv"
                 elif export_format == "GeoJSON":
@@ -205,7 +406,8 @@ def export_results():
                     mime = "application/json"
                     extension = "geojson"
                 elif export_format == "Excel":
-                    gdf.to_excel(tmp.name, index=False)
+                    # Excel cells are too small for WKB, so only attributes are exported
+                    _attribute_table(gdf).to_excel(tmp.name, index=False, engine="openpyxl")
                     mime = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                     extension = "xlsx"
                 elif export_format == "PDF Report":
@@ -224,11 +426,14 @@ def export_results():
                     
                     # Add statistics
                     pdf.cell(200, 10, txt="Summary Statistics:", ln=1, align='L')
-                    for col in gdf.select_dtypes(include=['float64', 'int64']).columns:
-                        stats = gdf[col].describe()
-                        pdf.cell(200, 10, txt=f"{col}:", ln=1, align='L')
-                        for stat, value in stats.items():
-                            pdf.cell(200, 10, txt=f"  {stat}: {value:.2f}", ln=1, align='L')
+                    stats = _numeric_describe(st.session_state.current_file, gdf)
+                    if not stats.empty:
+                        # One row per column keeps the table page-wide
+                        # however many numeric columns there are
+                        stats = stats.T.round(2)
+                        stats.index = stats.index.astype(str).str.slice(0, 20)
+                        pdf.set_font("Courier", size=8)
+                        pdf.multi_cell(0, 5, txt=stats.to_string())
                     
                     pdf.output(tmp.name)
                     mime = "application/pdf"
@@ -257,23 +462,11 @@ def render_llm_analysis():
                 stats = {
                     "feature_count": len(gdf),
                     "attributes": list(gdf.columns),
-                    "geometry_types": gdf.geometry.type.unique().tolist(),
-                    "numeric_stats": gdf.describe().to_dict()
+                    "geometry_types": _geometry_types(st.session_state.current_file, gdf),
+                    "numeric_stats": _numeric_describe(st.session_state.current_file, gdf).to_dict()
                 }
                 
-                prompt = f"""
-                Analyze these GIS dataset statistics and identify interesting patterns:
-                
-                {json.dumps(stats, indent=2)}
-                
-                Focus on:
-                1. Distribution patterns
-                2. Spatial relationships
-                3. Potential correlations
-                4. Anomalies or outliers
-                """
-                
-                analysis = st.session_state.llm.explain_analysis(stats)
+                analysis = _get_llm().explain_analysis(stats)
                 st.markdown(analysis)
         
         # Recommendations
@@ -282,43 +475,33 @@ def render_llm_analysis():
                 gdf = st.session_state.current_data
                 data = {
                     "columns": list(gdf.columns),
-                    "geometry_type": gdf.geometry.type.unique().tolist(),
+                    "geometry_type": _geometry_types(st.session_state.current_file, gdf),
                     "feature_count": len(gdf)
                 }
                 
-                prompt = f"""
-                Based on this GIS dataset structure, suggest analysis approaches:
-                
-                {json.dumps(data, indent=2)}
-                
-                Recommend:
-                1. Useful visualizations
-                2. Statistical analyses
-                3. Spatial operations
-                4. Additional data that could enhance the analysis
-                """
-                
-                recommendations = st.session_state.llm.generate_description(data)
+                recommendations = _get_llm().generate_description(data)
                 st.markdown(recommendations)
 
 def render_analysis():
     """Render the analysis section."""
     if st.session_state.current_data is not None:
+        from walter.commands.describe import analyze_dataset, generate_description
+        from walter.utils.gis import validate_geometry
+        
         st.title("📊 Analysis")
         
         # Generate description
         if st.button("Generate Description"):
             with st.spinner("Generating description..."):
                 data = analyze_dataset(st.session_state.current_file)
-                description = st.session_state.llm.generate_description(data)
+                description = _get_llm().generate_description(data)
                 st.markdown(description)
         
         # Generate tags
         if st.button("Suggest Tags"):
             with st.spinner("Generating tags..."):
-                data = analyze_dataset(st.session_state.current_file)
                 description = generate_description(st.session_state.current_file)
-                tags = st.session_state.llm.suggest_tags(description)
+                tags = _get_llm().suggest_tags(description)
                 
                 for tag in tags:
                     st.markdown(f"🏷️ `{tag}`")
@@ -345,6 +528,7 @@ def main():
     
     # Initialize session state
     init_session_state()
+    _sweep_stale_files()
     
     # Render sidebar
     render_sidebar()
@@ -1,16 +1,18 @@
 """
 Walter integrations package
 """
+import importlib
+import importlib.util
 
-from . import gitbook
-from . import llm
-
-try:
-    from . import agol
-    HAS_AGOL = True
-except ImportError:
-    HAS_AGOL = False
+# The AGOL integration needs the optional ArcGIS API for Python
+HAS_AGOL = importlib.util.find_spec("arcgis") is not None
 
 __all__ = ["gitbook", "llm"]
 if HAS_AGOL:
-    __all__.append("agol") 
\ No newline at end of file
+    __all__.append("agol")
+
+def __getattr__(name):
+    """Import integration modules on first access."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
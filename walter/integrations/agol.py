@@ -2,12 +2,42 @@
 ArcGIS Online integration for Walter
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-from arcgis.gis import GIS
-from arcgis.features import FeatureLayer
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 import geopandas as gpd
-import json
+import numpy as np
+import pandas as pd
+import shapely
+
+if TYPE_CHECKING:
+    from arcgis.features import FeatureLayer
+
+# Features sent per edit_features request
+FEATURE_CHUNK_SIZE = 1000
+
+# Maximum number of concurrent feature uploads
+MAX_UPLOAD_WORKERS = 8
+
+# AGOL geometry types indexed by shapely.get_type_id
+ESRI_GEOMETRY_TYPES = (
+    "esriGeometryPoint",  # Point
+    "esriGeometryPolyline",  # LineString
+    "esriGeometryPoint",  # LinearRing (unsupported)
+    "esriGeometryPolygon",  # Polygon
+    "esriGeometryMultipoint",  # MultiPoint
+    "esriGeometryPolyline",  # MultiLineString
+    "esriGeometryPolygon",  # MultiPolygon
+)
+
+# AGOL field types by pandas dtype
+ESRI_FIELD_TYPES = {
+    np.dtype("int64"): "esriFieldTypeInteger",
+    np.dtype("float64"): "esriFieldTypeDouble",
+    np.dtype("object"): "esriFieldTypeString",
+    np.dtype("bool"): "esriFieldTypeSmallInteger",
+    np.dtype("datetime64[ns]"): "esriFieldTypeDate",
+}
 
 class AGOLManager:
     """ArcGIS Online content manager for Walter."""
@@ -27,6 +57,8 @@ class AGOLManager:
                 "ArcGIS Online credentials not found. Set AGOL_USERNAME and AGOL_PASSWORD environment variables."
             )
         
+        from arcgis.gis import GIS
+        
         self.gis = GIS(portal_url, self.username, self.password)
 
     def upload_data(
@@ -92,18 +124,29 @@ class AGOLManager:
         description: Optional[str] = None,
     ) -> Dict:
         """Create a feature service from a GeoDataFrame."""
-        # Convert GeoDataFrame to JSON
-        geojson = json.loads(gdf.to_json())
+        # Datetimes are not JSON serializable, so send them as ISO strings;
+        # only the copy used for the payload is converted, keeping the schema dtypes
+        payload_gdf = gdf
+        datetime_cols = gdf.select_dtypes(include=["datetime", "datetimetz"]).columns
+        if len(datetime_cols) > 0:
+            payload_gdf = gdf.assign(**{
+                col: gdf[col].map(lambda value: value.isoformat() if pd.notna(value) else None)
+                for col in datetime_cols
+            })
+        
+        # Convert GeoDataFrame to GeoJSON-like dicts without a text round trip
+        geojson = payload_gdf.__geo_interface__
         
         # Create feature collection
+        geom_type = self._get_geometry_type(gdf)
         features = {
             "layerDefinition": {
-                "geometryType": self._get_geometry_type(gdf),
+                "geometryType": geom_type,
                 "fields": self._get_fields_schema(gdf),
             },
             "featureSet": {
                 "features": geojson["features"],
-                "geometryType": self._get_geometry_type(gdf),
+                "geometryType": geom_type,
             },
         }
         
@@ -114,9 +157,11 @@ class AGOLManager:
             description=description or f"Feature service created by Walter: {title}",
         )
         
-        # Add features
+        # Add features in chunks, uploaded concurrently
+        from arcgis.features import FeatureLayer
+        
         layer = FeatureLayer.fromitem(service)
-        layer.edit_features(adds=geojson["features"])
+        self._add_features(layer, geojson["features"])
         
         return {
             "id": service.id,
@@ -125,6 +170,25 @@ class AGOLManager:
             "type": service.type,
         }
 
+    def _add_features(self, layer: "FeatureLayer", features: List[Dict]) -> None:
+        """Add features to a layer in parallel chunks of FEATURE_CHUNK_SIZE."""
+        chunks = [
+            features[i:i + FEATURE_CHUNK_SIZE]
+            for i in range(0, len(features), FEATURE_CHUNK_SIZE)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+            results = list(executor.map(lambda chunk: layer.edit_features(adds=chunk), chunks))
+        
+        failures = [
+            r for result in results for r in result.get("addResults", [])
+            if not r.get("success")
+        ]
+        if failures:
+            raise RuntimeError(
+                f"Failed to add {len(failures)} of {len(features)} features: {failures[0].get('error')}"
+            )
+
     def _get_content_type(self, file_path: Path) -> str:
         """Determine AGOL content type from file extension."""
         extension_map = {
@@ -138,35 +202,22 @@ class AGOLManager:
 
     def _get_geometry_type(self, gdf: gpd.GeoDataFrame) -> str:
         """Get AGOL geometry type from GeoDataFrame."""
-        geom_type = gdf.geometry.geom_type.iloc[0]
-        type_map = {
-            "Point": "esriGeometryPoint",
-            "LineString": "esriGeometryPolyline",
-            "Polygon": "esriGeometryPolygon",
-            "MultiPoint": "esriGeometryMultipoint",
-            "MultiLineString": "esriGeometryPolyline",
-            "MultiPolygon": "esriGeometryPolygon",
-        }
-        return type_map.get(geom_type, "esriGeometryPoint")
+        type_id = shapely.get_type_id(gdf.geometry.iat[0])
+        if 0 <= type_id < len(ESRI_GEOMETRY_TYPES):
+            return ESRI_GEOMETRY_TYPES[type_id]
+        return "esriGeometryPoint"
 
     def _get_fields_schema(self, gdf: gpd.GeoDataFrame) -> List[Dict]:
         """Generate AGOL fields schema from GeoDataFrame."""
-        type_map = {
-            "int64": "esriFieldTypeInteger",
-            "float64": "esriFieldTypeDouble",
-            "object": "esriFieldTypeString",
-            "bool": "esriFieldTypeSmallInteger",
-            "datetime64[ns]": "esriFieldTypeDate",
-        }
+        dtypes = gdf.dtypes.drop(gdf.geometry.name, errors="ignore")
+        field_types = dtypes.map(lambda dtype: ESRI_FIELD_TYPES.get(dtype, "esriFieldTypeString"))
         
-        fields = []
-        for col, dtype in gdf.dtypes.items():
-            if col != "geometry":
-                fields.append({
-                    "name": col,
-                    "alias": col,
-                    "type": type_map.get(str(dtype), "esriFieldTypeString"),
-                    "nullable": True,
-                })
-        
-        return fields 
\ No newline at end of file
+        return [
+            {
+                "name": col,
+                "alias": col,
+                "type": field_type,
+                "nullable": True,
+            }
+            for col, field_type in field_types.items()
+        ]
\ No newline at end of file
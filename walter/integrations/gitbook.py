@@ -2,11 +2,23 @@
 GitBook integration for Walter
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import requests
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional, Tuple
 import yaml
 from jinja2 import Environment, FileSystemLoader
+from urllib3.util.retry import Retry
+
+# Maximum number of GitBook API requests in flight at once
+MAX_CONCURRENT_REQUESTS = 16
+
+# Maximum number of pages sent in one batch request
+BATCH_SIZE = 50
+
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 class GitBookAPI:
     """GitBook API client for Walter."""
@@ -22,6 +34,35 @@ class GitBookAPI:
             "Authorization": f"Bearer {self.api_token}",
             "Content-Type": "application/json",
         }
+        
+        # Reuse connections across calls; PATCH is safe to retry, POST is not
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"PATCH"},
+        )
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS * 2,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", adapter)
+        
+        # Cleared once the batch endpoint turns out to be unavailable
+        self.supports_batch = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
 
     def create_page(self, space_id: str, title: str, content: str) -> Dict:
         """Create a new page in GitBook space."""
@@ -30,15 +71,38 @@ class GitBookAPI:
             "title": title,
             "content": content,
         }
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self.session.post(url, json=data)
         response.raise_for_status()
         return response.json()
 
+    def create_pages(self, space_id: str, pages: List[Dict]) -> List[Dict]:
+        """
+        Create up to BATCH_SIZE pages in a GitBook space with one request.
+        
+        Args:
+            space_id: GitBook space ID
+            pages: Page payloads with "title" and "content" keys
+            
+        Returns:
+            Created pages, in the order given
+        """
+        url = f"{self.base_url}/spaces/{space_id}/content:batch"
+        response = self.session.post(url, json={"pages": pages})
+        if response.status_code in (404, 405):
+            self.supports_batch = False
+        response.raise_for_status()
+        
+        body = response.json()
+        created = body.get("pages") if isinstance(body, dict) else None
+        if not isinstance(created, list) or len(created) != len(pages):
+            raise ValueError("Unexpected response from the GitBook batch endpoint")
+        return created
+
     def update_page(self, space_id: str, page_id: str, content: str) -> Dict:
         """Update an existing GitBook page."""
         url = f"{self.base_url}/spaces/{space_id}/content/{page_id}"
         data = {"content": content}
-        response = requests.patch(url, headers=self.headers, json=data)
+        response = self.session.patch(url, json=data)
         response.raise_for_status()
         return response.json()
 
@@ -48,25 +112,35 @@ class GitBookPublisher:
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize GitBook publisher."""
         self.config_path = config_path or Path.home() / ".walter" / "gitbook.yml"
+        self._config = None
+        self._config_mtime = None
         self.api = GitBookAPI()
         self.env = Environment(
             loader=FileSystemLoader(Path(__file__).parent / "templates"),
             trim_blocks=True,
             lstrip_blocks=True,
+            auto_reload=False,
         )
+        self._summary_template = self.env.get_template("gitbook_summary.md.j2")
 
     def load_config(self) -> Dict:
         """Load GitBook configuration."""
         if not self.config_path.exists():
             raise FileNotFoundError(f"GitBook config not found at {self.config_path}")
         
+        # Reuse the parsed config until the file changes
+        mtime = self.config_path.stat().st_mtime_ns
+        if self._config is not None and mtime == self._config_mtime:
+            return self._config
+        
         with open(self.config_path) as f:
-            return yaml.safe_load(f)
+            self._config = yaml.load(f, Loader=YAML_LOADER)
+        self._config_mtime = mtime
+        return self._config
 
     def create_summary(self, pages: List[Dict]) -> str:
         """Generate SUMMARY.md content."""
-        template = self.env.get_template("gitbook_summary.md.j2")
-        return template.render(pages=pages)
+        return self._summary_template.render(pages=pages)
 
     def publish_content(
         self,
@@ -87,37 +161,110 @@ class GitBookPublisher:
         else:
             return self.api.create_page(space_id, title, content)
 
+    def _create_pages(
+        self,
+        space_id: str,
+        pages: List[Tuple[str, str]],
+        batch: bool = False,
+    ) -> Tuple[List[Optional[Dict]], Dict[int, Exception]]:
+        """
+        Create (title, content) pages, collecting failures instead of
+        stopping at the first one.
+        
+        With batch set, pages are sent in BATCH_SIZE chunks until the batch
+        endpoint turns out to be unavailable; the remaining pages are then
+        created one request each.
+        
+        Returns:
+            Created pages in the order given (None where creation failed),
+            and the errors keyed by page index
+        """
+        created: List[Optional[Dict]] = [None] * len(pages)
+        errors: Dict[int, Exception] = {}
+        start = 0
+        if batch and self.api.supports_batch:
+            while start < len(pages):
+                chunk = pages[start:start + BATCH_SIZE]
+                try:
+                    created[start:start + len(chunk)] = self.api.create_pages(
+                        space_id,
+                        [{"title": title, "content": content} for title, content in chunk],
+                    )
+                except (requests.RequestException, ValueError) as e:
+                    if not self.api.supports_batch:
+                        break
+                    errors.update(dict.fromkeys(range(start, start + len(chunk)), e))
+                start += len(chunk)
+        
+        # Publish the rest concurrently, bounded to stay clear of API rate limits
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            futures = {
+                index: executor.submit(self.api.create_page, space_id, *pages[index])
+                for index in range(start, len(pages))
+            }
+        for index, future in futures.items():
+            error = future.exception()
+            if error is None:
+                created[index] = future.result()
+            else:
+                errors[index] = error
+        return created, errors
+
     def sync_directory(self, source_dir: Path, space_id: Optional[str] = None) -> List[Dict]:
-        """Sync a directory of markdown files to GitBook."""
+        """
+        Sync a directory of markdown files to GitBook.
+        
+        Set ``batch_pages: true`` in the GitBook config to create pages
+        through the batch endpoint instead of one request per page.
+        
+        Pages that fail do not stop the others; SUMMARY.md lists the pages
+        that were created, then one RuntimeError names every failed file.
+        """
         config = self.load_config()
         space_id = space_id or config.get("default_space")
         
         if not space_id:
             raise ValueError("GitBook space ID not provided")
         
-        published_pages = []
+        # Process all markdown files except the generated summary
+        md_files = [p for p in source_dir.rglob("*.md") if p.name != "SUMMARY.md"]
+        with ThreadPoolExecutor() as executor:
+            contents = [
+                data.decode("utf-8", errors="replace")
+                for data in executor.map(Path.read_bytes, md_files)
+            ]
         
-        # Process all markdown files
-        for md_file in source_dir.glob("**/*.md"):
-            if md_file.name == "SUMMARY.md":
-                continue
-                
-            with open(md_file) as f:
-                content = f.read()
-            
-            # Use filename as title if not specified in frontmatter
-            title = md_file.stem.replace("-", " ").title()
-            
-            result = self.publish_content(content, title, space_id)
-            published_pages.append({
+        # Use filename as title if not specified in frontmatter
+        titles = [md_file.stem.replace("-", " ").title() for md_file in md_files]
+        
+        results, errors = self._create_pages(
+            space_id,
+            list(zip(titles, contents)),
+            batch=bool(config.get("batch_pages", False)),
+        )
+        published_pages = [
+            {
                 "title": title,
                 "path": str(md_file.relative_to(source_dir)),
                 "id": result["id"],
-            })
+            }
+            for md_file, title, result in zip(md_files, titles, results)
+            if result is not None
+        ]
         
-        # Generate and update SUMMARY.md
+        # Generate and update SUMMARY.md, keeping every page that was created
         summary = self.create_summary(published_pages)
         summary_path = source_dir / "SUMMARY.md"
         summary_path.write_text(summary)
         
+        if errors:
+            failed = "\n".join(
+                f"  {md_files[index].relative_to(source_dir)}: {errors[index]}"
+                for index in sorted(errors)
+            )
+            raise RuntimeError(
+                f"Failed to publish {len(errors)} of {len(md_files)} pages to GitBook "
+                f"({len(published_pages)} published and listed in SUMMARY.md):\n{failed}"
+            ) from errors[min(errors)]
+        
         return published_pages 
\ No newline at end of file
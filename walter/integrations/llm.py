@@ -2,15 +2,39 @@
 LLM integration for Walter using Ollama
 """
 import os
+import hashlib
+import time
+from pathlib import Path
 from typing import Optional, Dict, List, Any
 import json
 import warnings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _to_json(data: Any) -> str:
+    """Serialize data for a prompt, using orjson when it is installed."""
+    if not data:
+        return json.dumps(data)
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2)
+
 class LLMManager:
     """Manager for LLM interactions."""
     
     DEFAULT_MODEL = "phi"  # Microsoft's Phi-2 model
     DEFAULT_CONTEXT = 2048  # Default context window
+    MODEL_CHECK_TTL = 24 * 60 * 60  # Seconds a successful model check is trusted
+    CACHE_DIR = Path.home() / ".walter" / "llm_cache"
     
     def __init__(
         self,
@@ -40,10 +64,18 @@ class LLMManager:
         """Ensure the selected model is available in Ollama."""
         if not self.llm_available:
             return
+        
+        # Skip the server round trip if the model was confirmed recently
+        key = f"{self.model}@{os.getenv('OLLAMA_HOST', '')}"
+        marker = self.CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.ok"
+        if marker.exists() and time.time() - marker.stat().st_mtime < self.MODEL_CHECK_TTL:
+            return
             
         try:
             models = self.ollama.list()
-            model_names = [m['name'] for m in models['models']]
+            model_names = {m['name'] for m in models['models']}
+            # Ollama resolves a bare model name to its ":latest" tag only
+            model_names |= {name[:-len(':latest')] for name in model_names if name.endswith(':latest')}
             
             if self.model not in model_names:
                 print(f"Model {self.model} not found. Pulling from Ollama...")
@@ -51,6 +83,13 @@ class LLMManager:
         except Exception as e:
             self.llm_available = False
             warnings.warn(f"Failed to initialize Ollama: {str(e)}")
+            return
+        
+        try:
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError:
+            pass
     
     def generate_description(self, data: Dict[str, Any]) -> str:
         """
@@ -137,7 +176,7 @@ class LLMManager:
         prompt = f"""
         Explain these GIS analysis results in clear, natural language:
         
-        {json.dumps(analysis_results, indent=2)}
+        {_to_json(analysis_results)}
         
         Focus on key insights and patterns. Use professional but accessible language.
         """
@@ -190,7 +229,7 @@ class LLMManager:
         - Attributes: {', '.join(data.get('columns', []))}
         
         Statistics:
-        {json.dumps(data.get('geometry_stats', {}), indent=2)}
+        {_to_json(data.get('geometry_stats', {}))}
         
         Write a clear, professional description that a GIS analyst would find helpful.
         Focus on the key characteristics and potential uses of the dataset.
@@ -1,8 +1,12 @@
 """
 Walter utility modules
 """
+import importlib
 
-from . import gis
-from . import text
+__all__ = ["gis", "text"]
 
-__all__ = ["gis", "text"] 
\ No newline at end of file
+def __getattr__(name):
+    """Import utility modules on first access."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
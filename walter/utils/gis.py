@@ -1,9 +1,53 @@
 """
 GIS utility functions for Walter
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Sequence
 import geopandas as gpd
-from shapely.geometry import box
+import numpy as np
+import shapely
+from pyproj import CRS
+
+# Geometry type names indexed by shapely.get_type_id
+GEOMETRY_TYPE_NAMES = (
+    "Point",
+    "LineString",
+    "LinearRing",
+    "Polygon",
+    "MultiPoint",
+    "MultiLineString",
+    "MultiPolygon",
+    "GeometryCollection",
+)
+
+def read_gis_file(file_path, **kwargs) -> gpd.GeoDataFrame:
+    """
+    Read a GIS file through pyogrio, using the Arrow backend when available.
+    
+    Args:
+        file_path: Path to the GIS file
+        **kwargs: Extra keyword arguments passed to ``gpd.read_file``
+        
+    Returns:
+        GeoDataFrame with the file contents
+    """
+    try:
+        return gpd.read_file(file_path, engine="pyogrio", use_arrow=True, **kwargs)
+    except TypeError:
+        # Older pyogrio releases don't support use_arrow
+        return gpd.read_file(file_path, engine="pyogrio", **kwargs)
+
+def get_geometry_types(gdf: gpd.GeoDataFrame) -> List[str]:
+    """
+    Get the distinct geometry types present in a GeoDataFrame.
+    
+    Args:
+        gdf: GeoDataFrame to analyze
+        
+    Returns:
+        List of geometry type names, ignoring missing geometries
+    """
+    type_ids = np.unique(shapely.get_type_id(np.asarray(gdf.geometry.values)))
+    return [GEOMETRY_TYPE_NAMES[i] for i in type_ids if i >= 0]
 
 def get_crs_info(gdf: gpd.GeoDataFrame) -> str:
     """
@@ -23,39 +67,67 @@ def get_crs_info(gdf: gpd.GeoDataFrame) -> str:
         return crs
         
     # Handle pyproj CRS object
-    auth_name = crs.to_authority()[0] if crs.to_authority() else "Custom"
-    auth_code = crs.to_authority()[1] if crs.to_authority() else "Unknown"
-    
-    return f"{auth_name}:{auth_code}"
+    auth = crs.to_authority()
+    if auth:
+        return f"{auth[0]}:{auth[1]}"
+    return "Custom:Unknown"
 
-def get_geometry_stats(gdf: gpd.GeoDataFrame) -> Dict[str, Any]:
+def get_geometry_stats(
+    gdf: gpd.GeoDataFrame,
+    total_bounds: Optional[Sequence[float]] = None,
+) -> Dict[str, Any]:
     """
     Calculate basic geometric statistics for a GeoDataFrame.
     
     Args:
         gdf: GeoDataFrame to analyze
+        total_bounds: Precomputed (minx, miny, maxx, maxy), e.g. from layer metadata
         
     Returns:
         Dictionary of geometry statistics
     """
     # Get the total bounds
-    minx, miny, maxx, maxy = gdf.total_bounds
-    bbox = box(minx, miny, maxx, maxy)
+    if total_bounds is None:
+        total_bounds = gdf.total_bounds
+    minx, miny, maxx, maxy = total_bounds
+    
+    # Empty or all-null layers have no extent to center a projection on
+    has_extent = bool(np.isfinite(np.asarray(total_bounds, dtype=float)).all())
     
-    # Project to Web Mercator for area calculations if in geographic CRS
-    if gdf.crs and gdf.crs.is_geographic:
-        gdf_proj = gdf.to_crs("EPSG:3857")  # Web Mercator
-        area_unit = "square meters"
+    geographic = bool(gdf.crs and gdf.crs.is_geographic)
+    area_unit = "square meters" if geographic else "square units"
+    
+    if not has_extent:
+        areas = np.empty(0)
+        pminx = pminy = pmaxx = pmaxy = 0.0
     else:
-        gdf_proj = gdf
-        area_unit = "square units"
+        # Project only the geometries to an equal-area CRS centered on the
+        # data for area calculations if in geographic CRS
+        if geographic:
+            equal_area = CRS(
+                proj="laea",
+                lat_0=(miny + maxy) / 2,
+                lon_0=(minx + maxx) / 2,
+                datum="WGS84",
+                units="m",
+            )
+            geoms_proj = gdf.geometry.to_crs(equal_area)
+            pminx, pminy, pmaxx, pmaxy = geoms_proj.total_bounds
+        else:
+            geoms_proj = gdf.geometry
+            pminx, pminy, pmaxx, pmaxy = minx, miny, maxx, maxy
+        
+        # Compute areas once and reuse them for every statistic; null
+        # geometries have no area and are skipped
+        areas = geoms_proj.area.to_numpy()
+        areas = areas[~np.isnan(areas)]
     
     # Calculate statistics
     stats = {
         "bbox": f"({minx:.2f}, {miny:.2f}, {maxx:.2f}, {maxy:.2f})",
-        "total_area": gdf_proj.geometry.area.sum(),
-        "mean_area": gdf_proj.geometry.area.mean(),
-        "bbox_area": gdf_proj.geometry.total_bounds.area if hasattr(gdf_proj.geometry.total_bounds, 'area') else None,
+        "total_area": float(areas.sum()),
+        "mean_area": float(areas.mean()) if areas.size else 0.0,
+        "bbox_area": float((pmaxx - pminx) * (pmaxy - pminy)),
         "area_unit": area_unit,
     }
     
@@ -71,20 +143,19 @@ def validate_geometry(gdf: gpd.GeoDataFrame) -> Dict[str, Any]:
     Returns:
         Dictionary of validation results
     """
-    results = {
-        "valid": gdf.geometry.is_valid.all(),
-        "issues": [],
-    }
+    # One pass through GEOS gives both validity and the reasons
+    reasons = shapely.is_valid_reason(np.asarray(gdf.geometry.values))
+    positions = np.flatnonzero(reasons != "Valid Geometry")
     
-    # Check for common issues
-    if not results["valid"]:
-        invalid_geoms = gdf[~gdf.geometry.is_valid]
-        results["issues"] = [
+    results = {
+        "valid": positions.size == 0,
+        "issues": [
             {
                 "index": idx,
-                "reason": geom.validation_error
+                "reason": reason
             }
-            for idx, geom in invalid_geoms.geometry.items()
-        ]
+            for idx, reason in zip(gdf.index[positions], reasons[positions])
+        ],
+    }
     
     return results 
\ No newline at end of file
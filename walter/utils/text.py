@@ -13,14 +13,10 @@ def format_markdown(components: Dict[str, str]) -> str:
     Returns:
         Formatted Markdown string
     """
-    sections = []
-    
-    # Add each component as a section
-    for title, content in components.items():
-        section = f"### {title.title()}\n\n{content}\n"
-        sections.append(section)
-    
-    return "\n".join(sections)
+    return "\n".join(
+        f"### {title.title()}\n\n{content}\n"
+        for title, content in components.items()
+    )
 
 def format_html(components: Dict[str, str]) -> str:
     """
@@ -32,18 +28,11 @@ def format_html(components: Dict[str, str]) -> str:
     Returns:
         Formatted HTML string
     """
-    sections = []
-    
-    # Add each component as a section
-    for title, content in components.items():
-        section = f"<h3>{title.title()}</h3>\n<p>{content}</p>"
-        sections.append(section)
-    
-    return "\n".join([
+    return "\n".join((
         "<div class='walter-output'>",
-        *sections,
-        "</div>"
-    ])
+        *(f"<h3>{title.title()}</h3>\n<p>{content}</p>" for title, content in components.items()),
+        "</div>",
+    ))
 
 def format_text(components: Dict[str, str]) -> str:
     """
@@ -55,14 +44,17 @@ def format_text(components: Dict[str, str]) -> str:
     Returns:
         Formatted text string
     """
-    sections = []
-    
-    # Add each component as a section
-    for title, content in components.items():
-        section = f"{title.upper()}\n{'=' * len(title)}\n{content}\n"
-        sections.append(section)
-    
-    return "\n".join(sections)
+    return "\n".join(
+        f"{title.upper()}\n{'=' * len(title)}\n{content}\n"
+        for title, content in components.items()
+    )
+
+# Output formatters by format name
+FORMATTERS = {
+    "markdown": format_markdown,
+    "html": format_html,
+    "text": format_text,
+}
 
 def format_output(components: Dict[str, str], format: str = "markdown") -> str:
     """
@@ -75,11 +67,5 @@ def format_output(components: Dict[str, str], format: str = "markdown") -> str:
     Returns:
         Formatted string in the requested format
     """
-    formatters = {
-        "markdown": format_markdown,
-        "html": format_html,
-        "text": format_text,
-    }
-    
-    formatter = formatters.get(format.lower(), format_text)
-    return formatter(components) 
\ No newline at end of file
+    formatter = FORMATTERS.get(format.lower(), format_text)
+    return formatter(components)
\ No newline at end of file